@@ -4,7 +4,14 @@ from pathlib import Path
 import pandas as pd
 
 from life_expectancy.regions import Region
-from life_expectancy.cleaning import clean_data
+from life_expectancy.cleaning import (
+    load_data,
+    split_metadata_columns,
+    melt_years,
+    clean_types,
+    filter_countries,
+    index_by_region,
+)
 
 # Directories
 PACKAGE_DIR = Path(__file__).parent
@@ -14,7 +21,7 @@ FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
 
 # Load full raw dataset
 raw_file = DATA_DIR / "eu_life_expectancy_raw.tsv"
-df_full = pd.read_csv(raw_file, sep="\t")
+df_full = load_data(str(raw_file))
 
 # Create sample with at least some rows from each country
 df_pt = df_full[df_full.iloc[:, 0].str.contains("PT")].head(2)
@@ -26,9 +33,19 @@ df_sample = pd.concat([df_pt, df_es, df_fr], ignore_index=True)
 sample_file = FIXTURES_DIR / "eu_life_expectancy_raw_sample.tsv"
 df_sample.to_csv(sample_file, sep="\t", index=False)
 
+# Clean the sample once (the split, melt and type cleaning stages are
+# country-agnostic), keep the fixture countries in a single pass and
+# index their rows by region
+countries = [Region.PT, Region.ES, Region.FR]
+df_clean = clean_types(melt_years(split_metadata_columns(df_sample)))
+df_clean = filter_countries(df_clean, countries)
+region_index = index_by_region(df_clean)
+
 # Generate expected cleaned CSV for each country
-for country in [Region.PT, Region.ES, Region.FR]:
-    df_expected = clean_data(df_sample, country=country)
+for country in countries:
+    df_expected = df_clean.take(region_index[country.value]).reset_index(
+        drop=True
+    )
     expected_file = (
         FIXTURES_DIR / f"{country.name.lower()}_life_expectancy_expected.csv"
     )
@@ -2,27 +2,59 @@
 import pandas as pd
 import pytest
 
+from life_expectancy.cleaning import (
+    clean_types,
+    melt_years,
+    split_metadata_columns,
+)
 from . import FIXTURES_DIR
 
-@pytest.fixture(scope="session")
-def eu_life_expectancy_sample() -> pd.DataFrame:
+# Metadata columns are categoricals, years are int16 and values
+# are float32 in the cleaned output
+EXPECTED_DTYPES = {
+    "unit": "category",
+    "sex": "category",
+    "age": "category",
+    "region": "category",
+    "year": "int16",
+    "value": "float32",
+}
+
+@pytest.fixture(scope="session", name="eu_life_expectancy_sample")
+def fixture_eu_life_expectancy_sample() -> pd.DataFrame:
     """Return the sample input for tests."""
     return pd.read_csv(
         FIXTURES_DIR / "eu_life_expectancy_raw_sample.tsv",
         sep="\t"
     )
 
+@pytest.fixture(scope="session")
+def eu_cleaned_long(eu_life_expectancy_sample) -> pd.DataFrame:
+    """Return the whole sample cleaned to long format, for every region."""
+    return clean_types(
+        melt_years(split_metadata_columns(eu_life_expectancy_sample))
+    )
+
 @pytest.fixture(scope="session")
 def pt_life_expectancy_expected() -> pd.DataFrame:
     """Expected output for Portugal (PT)."""
-    return pd.read_csv(FIXTURES_DIR / "pt_life_expectancy_expected.csv")
+    return pd.read_csv(
+        FIXTURES_DIR / "pt_life_expectancy_expected.csv",
+        dtype=EXPECTED_DTYPES
+    )
 
 @pytest.fixture(scope="session")
 def es_life_expectancy_expected() -> pd.DataFrame:
     """Expected output for Spain (ES)."""
-    return pd.read_csv(FIXTURES_DIR / "es_life_expectancy_expected.csv")
+    return pd.read_csv(
+        FIXTURES_DIR / "es_life_expectancy_expected.csv",
+        dtype=EXPECTED_DTYPES
+    )
 
 @pytest.fixture(scope="session")
 def fr_life_expectancy_expected() -> pd.DataFrame:
     """Expected output for France (FR)."""
-    return pd.read_csv(FIXTURES_DIR / "fr_life_expectancy_expected.csv")
+    return pd.read_csv(
+        FIXTURES_DIR / "fr_life_expectancy_expected.csv",
+        dtype=EXPECTED_DTYPES
+    )
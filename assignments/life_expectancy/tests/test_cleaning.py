@@ -1,16 +1,21 @@
 """Tests for the cleaning module"""
 import pytest
+import numpy as np
 import pandas as pd
 from life_expectancy.regions import Region
 from life_expectancy.cleaning import (
     clean_data
     , split_metadata_columns
     , melt_years
+    , get_year_columns
     , clean_types
     , filter_country
+    , filter_countries
+    , index_by_region
     , load_data
+    , clean_data_streaming
 )
-from . import OUTPUT_DIR
+from . import FIXTURES_DIR, OUTPUT_DIR
 
 @pytest.mark.parametrize(
     "country, expected_fixture",
@@ -23,21 +28,78 @@ from . import OUTPUT_DIR
 def test_clean_data(
     country,
     expected_fixture,
-    eu_life_expectancy_sample,
+    eu_cleaned_long,
     request,
 ):
     """
-    Run the cleaning pipeline for different countries using the sample fixture.
+    Filter the cleaned sample for different countries.
     Compare actual output with expected fixture.
     """
-    # Clean the sample data for the given country
-    df_cleaned = clean_data(eu_life_expectancy_sample, country=country)
+    # The sample is cleaned once per session; only filter per country
+    df_cleaned = filter_country(eu_cleaned_long, country).reset_index(drop=True)
 
     # Get the expected DataFrame from the fixture dynamically
     df_expected = request.getfixturevalue(expected_fixture)
 
-    # Compare actual vs expected
-    pd.testing.assert_frame_equal(df_cleaned, df_expected)
+    # Column order is part of the CSV written by save_data, so pin it
+    # explicitly; check_like then compares the values by label
+    assert list(df_cleaned.columns) == [
+        "unit", "sex", "age", "region", "year", "value"
+    ]
+    pd.testing.assert_frame_equal(
+        df_cleaned, df_expected, check_like=True, check_categorical=False
+    )
+
+
+@pytest.mark.parametrize("country", [Region.PT, Region.ES, Region.FR])
+def test_clean_data_filters_before_melt(
+    country, eu_life_expectancy_sample, eu_cleaned_long
+):
+    """
+    Filtering the wide frame early must give the same result as running
+    every stage on the full sample and filtering at the end.
+    """
+    df_expected = filter_country(eu_cleaned_long, country).reset_index(
+        drop=True
+    )
+
+    df_cleaned = clean_data(eu_life_expectancy_sample, country=country)
+
+    # The full pipeline keeps every sample region among the categories
+    pd.testing.assert_frame_equal(
+        df_cleaned, df_expected, check_categorical=False
+    )
+
+
+@pytest.mark.parametrize("country", [Region.PT, Region.ES, Region.FR])
+def test_clean_data_streaming(country, eu_life_expectancy_sample):
+    """
+    Cleaning the sample file in small chunks must give the same result
+    as cleaning the fully loaded sample.
+    """
+    df_streamed = clean_data_streaming(
+        country,
+        raw_file=FIXTURES_DIR / "eu_life_expectancy_raw_sample.tsv",
+        chunksize=2
+    )
+
+    df_expected = clean_data(eu_life_expectancy_sample, country=country)
+
+    pd.testing.assert_frame_equal(df_streamed, df_expected)
+
+
+def test_clean_data_streaming_no_rows():
+    """Streaming a country missing from the file gives an empty frame."""
+    df_streamed = clean_data_streaming(
+        Region.XK,
+        raw_file=FIXTURES_DIR / "eu_life_expectancy_raw_sample.tsv",
+        chunksize=2
+    )
+
+    assert df_streamed.empty
+    assert list(df_streamed.columns) == [
+        "unit", "sex", "age", "region", "year", "value"
+    ]
 
 
 def test_split_metadata_columns(eu_life_expectancy_sample):
@@ -80,6 +142,10 @@ def test_melt_years():
     # Check that we have 2 rows (one for each year)
     assert len(df_long) == 2
 
+    # Check that the year column names were parsed to integers
+    assert list(df_long["year"]) == [2020, 2021]
+    assert df_long["year"].dtype == np.int16
+
     # Check that metadata columns are preserved
     assert "unit" in df_long.columns
     assert "sex" in df_long.columns
@@ -87,21 +153,69 @@ def test_melt_years():
     assert "region" in df_long.columns
 
 
+def test_melt_years_without_year_columns():
+    """Test that melt_years returns an empty long frame with no years."""
+    df_wide = split_metadata_columns(
+        pd.DataFrame({"unit,sex,age,geo\\time": ["YR,F,Y1,PT"]})
+    )
+
+    df_long = melt_years(df_wide)
+
+    assert df_long.empty
+    assert list(df_long.columns) == [
+        "unit", "sex", "age", "region", "year", "value"
+    ]
+
+
+def test_get_year_columns(eu_life_expectancy_sample):
+    """
+    Test that get_year_columns finds the year columns by name,
+    wherever they are.
+    """
+    df_wide = pd.DataFrame({
+        "unit": ["YR"],
+        "2021 ": ["11.0"],
+        "composed": ["a,b,c,PT"],
+        "2020 ": ["10.5"],
+    })
+
+    assert get_year_columns(df_wide) == ["2021 ", "2020 "]
+    assert get_year_columns(eu_life_expectancy_sample) == list(
+        eu_life_expectancy_sample.columns[1:]
+    )
+
+
 def test_clean_types(eu_life_expectancy_sample):
     """
     Test that clean_types correctly converts
-    'year' to int and 'value' to float.
+    'year' to int16 and 'value' to float32.
     """
     df = split_metadata_columns(eu_life_expectancy_sample)
     df = melt_years(df)
     df = clean_types(df)
 
     # Check types
-    assert df["year"].dtype == int
-    assert df["value"].dtype == float
+    assert df["year"].dtype == np.int16
+    assert df["value"].dtype == np.float32
     assert not df["value"].isna().any()
 
 
+def test_clean_types_strips_flags():
+    """
+    Test that clean_types strips flags from string values
+    and drops values that can't be parsed.
+    """
+    df = pd.DataFrame({
+        "year": [2019, 2020, 2021, 2022],
+        "value": ["21.7 e", "18.5*", ": ", "1.2.3"]
+    })
+
+    df_clean = clean_types(df)
+
+    assert list(df_clean["year"]) == [2019, 2020]
+    np.testing.assert_allclose(df_clean["value"], [21.7, 18.5], rtol=1e-6)
+
+
 def test_filter_country():
     """
     Test that filter_country correctly filters data
@@ -120,6 +234,47 @@ def test_filter_country():
     assert len(df_pt) == 2
     assert all(df_pt["region"] == "PT")
 
+    # Check that filtering already filtered data is a no-op
+    pd.testing.assert_frame_equal(filter_country(df_pt, Region.PT), df_pt)
+
+
+def test_filter_countries():
+    """
+    Test that filter_countries keeps the rows of every
+    requested country, in their original order.
+    """
+    df_multi = pd.DataFrame({
+        "region": ["PT", "ES", "PT", "FR"],
+        "year": [2020, 2020, 2021, 2020],
+        "value": [80.5, 82.0, 81.0, 83.0]
+    })
+
+    df_selected = filter_countries(df_multi, [Region.PT, Region.FR])
+
+    assert list(df_selected["region"]) == ["PT", "PT", "FR"]
+    assert list(df_selected.index) == [0, 2, 3]
+
+
+def test_index_by_region():
+    """
+    Test that index_by_region maps each region
+    to the positions of its rows.
+    """
+    df_multi = pd.DataFrame({
+        "region": ["PT", "ES", "PT", "FR"],
+        "year": [2020, 2020, 2021, 2020],
+        "value": [80.5, 82.0, 81.0, 83.0]
+    })
+
+    region_index = index_by_region(df_multi)
+
+    assert set(region_index) == {"PT", "ES", "FR"}
+    assert list(region_index["PT"]) == [0, 2]
+    pd.testing.assert_frame_equal(
+        df_multi.take(region_index["PT"]),
+        filter_country(df_multi, Region.PT)
+    )
+
 
 def test_region_countries():
     """
@@ -178,6 +333,6 @@ def test_clean_data_json():
     expected_columns = {'unit', 'sex', 'age', 'region', 'year', 'value'}
     assert set(df_cleaned.columns) == expected_columns
 
-    # Check that year is int and value is float
-    assert df_cleaned['year'].dtype == 'int64'
-    assert df_cleaned['value'].dtype == 'float64'
+    # Check that year is int16 and value is float32
+    assert df_cleaned['year'].dtype == 'int16'
+    assert df_cleaned['value'].dtype == 'float32'
@@ -7,7 +7,7 @@ from life_expectancy.data_loaders import (
     JSONDataLoader,
     get_data_loader
 )
-from . import OUTPUT_DIR
+from . import FIXTURES_DIR, OUTPUT_DIR
 
 
 def test_tsv_data_loader():
@@ -24,6 +24,28 @@ def test_tsv_data_loader():
     assert df.columns[0].startswith("unit")
 
 
+def test_tsv_data_loader_chunks():
+    """Test TSVDataLoader reads a TSV file in chunks of rows."""
+    loader = TSVDataLoader()
+    file_path = str(FIXTURES_DIR / "eu_life_expectancy_raw_sample.tsv")
+
+    chunks = list(loader.load_chunks(file_path, chunksize=4))
+
+    # The chunks hold the same rows and columns as a full load
+    df = loader.load(file_path)
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+    assert all(list(chunk.columns) == list(df.columns) for chunk in chunks)
+    assert list(pd.concat(chunks).iloc[:, 0]) == list(df.iloc[:, 0])
+
+
+def test_json_data_loader_chunks_unsupported():
+    """Test JSONDataLoader rejects chunked loading."""
+    loader = JSONDataLoader()
+
+    with pytest.raises(NotImplementedError, match="chunked loading"):
+        next(loader.load_chunks("data/file.json", chunksize=2))
+
+
 def test_json_data_loader():
     """Test JSONDataLoader can load and standardize JSON files."""
     loader = JSONDataLoader()
@@ -73,3 +95,10 @@ def test_get_data_loader_case_insensitive():
 
     loader = get_data_loader("data/file.TSV")
     assert isinstance(loader, TSVDataLoader)
+
+
+def test_get_data_loader_reuses_instance():
+    """Test factory function returns one shared loader per extension."""
+    loader = get_data_loader("data/file.tsv")
+    assert get_data_loader("other/file.TSV") is loader
+    assert get_data_loader("data/file.json") is not loader
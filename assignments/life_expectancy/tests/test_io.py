@@ -1,6 +1,7 @@
 """Tests for I/O operations (load_data and save_data)"""
 from unittest.mock import patch
 import pandas as pd
+import pytest
 from life_expectancy.regions import Region
 from life_expectancy.cleaning import save_data, load_data
 
@@ -13,7 +14,9 @@ def test_load_data_reads_csv():
         df = load_data("fake.tsv")
 
         # Assert read_csv was called once with the correct arguments
-        mock_read.assert_called_once_with("fake.tsv", sep="\t")
+        mock_read.assert_called_once_with(
+            "fake.tsv", sep="\t", engine="pyarrow", dtype_backend="pyarrow"
+        )
 
         # Assert the return value is a DataFrame
         assert isinstance(df, pd.DataFrame)
@@ -28,7 +31,10 @@ def test_load_data_uses_default_path():
 
         # Assert it was called with the default path
         mock_read.assert_called_once_with(
-            "life_expectancy/data/eu_life_expectancy_raw.tsv", sep="\t"
+            "life_expectancy/data/eu_life_expectancy_raw.tsv",
+            sep="\t",
+            engine="pyarrow",
+            dtype_backend="pyarrow"
         )
 
 
@@ -62,3 +68,30 @@ def test_save_data_uses_correct_filename_for_country():
         mock_to_csv.assert_called_once_with(
             "output/es_life_expectancy.csv", index=False
         )
+
+
+def test_save_data_arrow_backend(tmp_path):
+    """
+    Test that the arrow backend writes a CSV that reads back
+    to the same data.
+    """
+    df = pd.DataFrame({
+        "region": pd.Categorical(["PT", "PT"]),
+        "year": [2020, 2021],
+        "value": [80.5, 81.0]
+    })
+
+    save_data(df, country=Region.PT, output_dir=tmp_path, backend="arrow")
+
+    df_saved = pd.read_csv(tmp_path / "pt_life_expectancy.csv")
+    pd.testing.assert_frame_equal(
+        df_saved, df.astype({"region": str}), check_dtype=False
+    )
+
+
+def test_save_data_unsupported_backend():
+    """Test that save_data raises ValueError for an unknown backend."""
+    df = pd.DataFrame({"a": [1, 2]})
+
+    with pytest.raises(ValueError, match="Unsupported CSV backend"):
+        save_data(df, country=Region.PT, output_dir="some/dir", backend="xml")
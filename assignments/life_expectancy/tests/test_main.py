@@ -1,7 +1,6 @@
 """Tests for the main orchestration function"""
-from unittest.mock import patch
+from unittest.mock import patch, sentinel
 
-import pandas as pd
 import pytest
 
 from life_expectancy.regions import Region
@@ -13,18 +12,15 @@ def test_main_orchestrates_pipeline(country):
     Test that main function orchestrates
     load_data, clean_data, and save_data correctly.
     """
-    mock_raw_df = pd.DataFrame({"col": ["data"]})
-    mock_clean_df = pd.DataFrame({"cleaned": ["data"]})
-
     with patch("life_expectancy.cleaning.load_data") as mock_load, \
          patch("life_expectancy.cleaning.clean_data") as mock_clean, \
          patch("life_expectancy.cleaning.save_data") as mock_save:
 
-        mock_load.return_value = mock_raw_df
-        mock_clean.return_value = mock_clean_df
+        mock_load.return_value = sentinel.raw_df
+        mock_clean.return_value = sentinel.clean_df
 
         main(country=country)
 
         mock_load.assert_called_once()
-        mock_clean.assert_called_once_with(mock_raw_df, country=country)
-        mock_save.assert_called_once_with(mock_clean_df, country=country)
+        mock_clean.assert_called_once_with(sentinel.raw_df, country=country)
+        mock_save.assert_called_once_with(sentinel.clean_df, country=country)